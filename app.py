@@ -1,18 +1,25 @@
 import os
-import glob
+import sys
+import csv
 import json
+import hashlib
+import functools
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import base64
-import tempfile
 import logging
 import subprocess
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+import orjson
 import pandas as pd
 import joblib
-from flask import Flask, request, render_template_string, jsonify, redirect, url_for
+from flask import Flask, request, redirect, url_for, Response
 from flask_cors import CORS
+from markupsafe import Markup, escape
 
 # AI Voice/Image imports
 try:
@@ -26,6 +33,20 @@ except ImportError as e:
     print(f"AI features not available: {e}")
     AI_FEATURES_AVAILABLE = False
 
+# Optional ONNX Runtime fast path for inference (see export_onnx.py)
+try:
+    import onnxruntime as ort
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+# Optional Numba JIT for the per-request feature-buffer writes
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Load environment variables for AI APIs
 from dotenv import load_dotenv
 load_dotenv()
@@ -45,14 +66,17 @@ CORS(app, resources={r"/api/*": {"origins": "*"}})
 # Artifact Loading
 # -----------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def _latest_metadata_file() -> str:
-    pattern = os.path.join(MODELS_DIR, 'model_metadata_*.json')
-    files = glob.glob(pattern)
+    # Cached: the models directory is static for the process lifetime, so we
+    # only hit the filesystem once even across debug-reloader re-imports.
+    with os.scandir(MODELS_DIR) as it:
+        files = [e.name for e in it
+                 if e.name.startswith('model_metadata_') and e.name.endswith('.json')]
     if not files:
         raise FileNotFoundError("No metadata JSON files found in 'models' directory.")
-    # sort by timestamp inside filename
-    files.sort(reverse=True)
-    return files[0]
+    # latest timestamp inside filename; max avoids sorting the whole list
+    return os.path.join(MODELS_DIR, max(files))
 
 def load_artifacts() -> Dict[str, Any]:
     meta_file = _latest_metadata_file()
@@ -80,13 +104,7 @@ def load_artifacts() -> Dict[str, Any]:
         # Fallback: parse dataset
         if not os.path.exists(DATASET_PATH):
             raise FileNotFoundError("Cannot infer feature names; dataset.csv not found.")
-        df = pd.read_csv(DATASET_PATH)
-        symptom_cols = [c for c in df.columns if c.lower().startswith('symptom')]
-        symptoms = set()
-        for col in symptom_cols:
-            vals = df[col].dropna().astype(str).str.strip()
-            symptoms.update(v for v in vals if v and v.lower() != 'nan')
-        feature_names = sorted(symptoms)
+        feature_names = _feature_names_from_dataset()
 
     return {
         'model': model,
@@ -95,40 +113,67 @@ def load_artifacts() -> Dict[str, Any]:
         'meta': meta
     }
 
+def _feature_names_from_dataset() -> List[str]:
+    """Collect unique symptom strings from the Symptom* columns of dataset.csv.
+
+    Prefers pyarrow's multithreaded CSV reader when installed; falls back to
+    pandas so the optional dependency stays optional.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pac
+    except ImportError:
+        pa = None
+
+    if pa is not None:
+        table = pac.read_csv(DATASET_PATH)
+        symptom_cols = [n for n in table.column_names if n.lower().startswith('symptom')]
+        chunks = [chunk for c in symptom_cols for chunk in table[c].drop_null().chunks]
+        vals = pa.concat_arrays(chunks).cast(pa.string()).unique().to_pylist()
+    else:
+        df = pd.read_csv(DATASET_PATH)
+        symptom_cols = [c for c in df.columns if c.lower().startswith('symptom')]
+        vals = set()
+        for col in symptom_cols:
+            vals.update(df[col].dropna().astype(str))
+
+    symptoms = {v.strip() for v in vals}
+    return sorted(s for s in symptoms if s and s.lower() != 'nan')
+
 def load_disease_info() -> Dict[str, Dict[str, Any]]:
-    """Load disease descriptions and precautions from CSV files."""
-    disease_info = {
-        'descriptions': {},
-        'precautions': {}
-    }
-    
+    """Load disease info from CSV files into one dict keyed by disease name.
+
+    Each entry carries whichever of 'description' and 'precautions' the CSVs
+    provide, so the prediction path needs a single lookup per disease. The
+    files are a few hundred rows, so stdlib csv reads them without paying
+    for DataFrame construction.
+    """
+    disease_info: Dict[str, Dict[str, Any]] = {}
+
     # Load descriptions
     try:
         if os.path.exists(DESCRIPTIONS_PATH):
-            desc_df = pd.read_csv(DESCRIPTIONS_PATH)
-            for _, row in desc_df.iterrows():
-                disease = row['Disease']
-                description = row['Description']
-                disease_info['descriptions'][disease] = description
+            with open(DESCRIPTIONS_PATH, newline='', encoding='utf-8-sig') as f:
+                for row in csv.DictReader(f):
+                    disease_info.setdefault(sys.intern(row['Disease']), {})['description'] = \
+                        row['Description']
     except Exception as e:
         print(f"Warning: Could not load descriptions: {e}")
-    
+
     # Load precautions
     try:
         if os.path.exists(PRECAUTIONS_PATH):
-            prec_df = pd.read_csv(PRECAUTIONS_PATH)
-            for _, row in prec_df.iterrows():
-                disease = row['Disease']
-                precautions = []
-                for i in range(1, 5):  # Precaution_1 to Precaution_4
-                    prec_col = f'Precaution_{i}'
-                    if prec_col in row and pd.notna(row[prec_col]) and row[prec_col].strip():
-                        precautions.append(row[prec_col].strip())
-                
-                disease_info['precautions'][disease] = precautions
+            with open(PRECAUTIONS_PATH, newline='', encoding='utf-8-sig') as f:
+                for row in csv.DictReader(f):
+                    precautions = [
+                        p for p in ((row.get(f'Precaution_{i}') or '').strip()
+                                    for i in range(1, 5)) if p
+                    ]
+                    disease_info.setdefault(sys.intern(row['Disease']), {})['precautions'] = \
+                        precautions
     except Exception as e:
         print(f"Warning: Could not load precautions: {e}")
-    
+
     return disease_info
 
 artifacts = load_artifacts()
@@ -136,57 +181,208 @@ disease_info = load_disease_info()
 MODEL = artifacts['model']
 LABEL_ENCODER = artifacts['label_encoder']
 FEATURE_NAMES: List[str] = artifacts['feature_names']
+# Class labels as interned Python str: dict lookups against disease_info hit
+# the identity fast path, and we skip numpy.str_ boxing and repeated str()
+# conversions during JSON serialization.
+CLASSES = tuple(sys.intern(str(c)) for c in LABEL_ENCODER.classes_)
+
+# Reusable single-row input buffer. Building a fresh dict + DataFrame per
+# prediction dominates latency for 1-row inference, so each thread keeps a
+# preallocated row and flips only the selected indices per request. The
+# buffers are thread-local: one shared row would let concurrent requests
+# clobber each other's features mid-predict.
+FEATURE_INDEX: Dict[str, int] = {name: i for i, name in enumerate(FEATURE_NAMES)}
+_X_LOCAL = threading.local()
+
+
+def _thread_buffer() -> Tuple[np.ndarray, pd.DataFrame]:
+    """Return this thread's (buffer, DataFrame view) pair, creating it lazily."""
+    try:
+        return _X_LOCAL.buf, _X_LOCAL.row
+    except AttributeError:
+        # float32 matches what sklearn's tree code (and ONNX Runtime's
+        # TreeEnsemble input) works in internally, so check_array doesn't
+        # make a dtype-conversion copy of the row on every predict.
+        buf = np.zeros((1, len(FEATURE_NAMES)), dtype=np.float32)
+        # DataFrame view over the buffer (copy=False) so the model still sees
+        # the training column names; mutations to buf are visible through it.
+        _X_LOCAL.buf = buf
+        _X_LOCAL.row = pd.DataFrame(buf, columns=FEATURE_NAMES, copy=False)
+        return buf, _X_LOCAL.row
+
+
+def _load_onnx_session():
+    """Build an ONNX Runtime session if an export sits next to the model.
+
+    Run export_onnx.py once to produce the .onnx file; without it (or without
+    onnxruntime installed) inference stays on the joblib model.
+    """
+    meta = artifacts['meta']
+    onnx_name = meta.get('onnx_file', os.path.splitext(meta['model_file'])[0] + '.onnx')
+    onnx_path = os.path.join(MODELS_DIR, onnx_name)
+    if not os.path.exists(onnx_path):
+        return None
+    try:
+        so = ort.SessionOptions()
+        so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        so.intra_op_num_threads = max(1, os.cpu_count() or 1)
+        return ort.InferenceSession(onnx_path, sess_options=so,
+                                    providers=['CPUExecutionProvider'])
+    except Exception as e:
+        print(f"Warning: Could not load ONNX model, using joblib model: {e}")
+        return None
+
+ORT_SESSION = _load_onnx_session() if ONNX_AVAILABLE else None
+ORT_INPUT_NAME = ORT_SESSION.get_inputs()[0].name if ORT_SESSION is not None else None
+
+
+def _set_feats(buf, idxs):
+    for i in idxs:
+        buf[i] = 1.0
+
+def _clear_feats(buf, idxs):
+    for i in idxs:
+        buf[i] = 0.0
+
+if NUMBA_AVAILABLE:
+    _set_feats = njit(cache=True)(_set_feats)
+    _clear_feats = njit(cache=True)(_clear_feats)
+    # Warm-compile now so the first request doesn't pay the JIT latency.
+    _warm_buf = np.zeros(1, dtype=np.float32)
+    _warm_idxs = np.zeros(1, dtype=np.int32)
+    _set_feats(_warm_buf, _warm_idxs)
+    _clear_feats(_warm_buf, _warm_idxs)
 
 # -----------------------------------------------------------------------------
 # Utility Functions
 # -----------------------------------------------------------------------------
 
-def build_feature_vector(selected: List[str]) -> pd.DataFrame:
-    """Return a single-row DataFrame matching the model's training columns.
+def ojsonify(obj) -> Response:
+    """jsonify replacement backed by orjson.
 
-    All features initialized to 0; set 1 for each selected symptom present in FEATURE_NAMES.
+    Emits bytes directly and serializes NumPy scalars natively, so response
+    payloads skip stdlib json's per-value Python boxing.
     """
-    data = {name: 0 for name in FEATURE_NAMES}
-    for s in selected:
-        if s in data:
-            data[s] = 1
-    return pd.DataFrame([data])
+    return Response(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+                    mimetype='application/json')
+
+
+# Responses for the static GET endpoints never change within a process, so
+# serialize them once and let clients revalidate cheaply via ETag.
+SYMPTOMS_JSON = orjson.dumps({'symptoms': FEATURE_NAMES})
+# Built once from the interned CLASSES tuple; /api/metadata never re-copies
+# the encoder's class array.
+METADATA_CACHE = {
+    'model_timestamp': artifacts['meta'].get('created'),
+    'n_classes': len(CLASSES),
+    'n_features': len(FEATURE_NAMES),
+    'classes': list(CLASSES),
+    'params': artifacts['meta'].get('params', {})
+}
+METADATA_JSON = orjson.dumps(METADATA_CACHE)
+# /api/disease-info keeps its historical split shape
+DISEASE_INFO_JSON = orjson.dumps({
+    'descriptions': {d: info['description'] for d, info in disease_info.items()
+                     if 'description' in info},
+    'precautions': {d: info['precautions'] for d, info in disease_info.items()
+                    if 'precautions' in info},
+})
+
+SYMPTOMS_ETAG = hashlib.md5(SYMPTOMS_JSON).hexdigest()
+METADATA_ETAG = hashlib.md5(METADATA_JSON).hexdigest()
+DISEASE_INFO_ETAG = hashlib.md5(DISEASE_INFO_JSON).hexdigest()
+
+
+def _cached_json_response(body: bytes, etag: str) -> Response:
+    """Serve a pre-serialized JSON body, answering 304 on a matching ETag."""
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304)
+    else:
+        resp = Response(body, mimetype='application/json')
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'public, max-age=3600'
+    return resp
+
+
+def build_feature_vector(selected: List[str]) -> Tuple[np.ndarray, pd.DataFrame, np.ndarray]:
+    """Fill this thread's single-row buffer with the selected symptoms.
+
+    Writes into the thread's preallocated buffer instead of building a new
+    frame; returns the buffer, its DataFrame view, and the touched indices,
+    which callers must zero again when done (see predict_disease).
+    """
+    buf, row = _thread_buffer()
+    idxs = np.fromiter(
+        (FEATURE_INDEX[s] for s in selected if s in FEATURE_INDEX),
+        dtype=np.int32,
+    )
+    _set_feats(buf[0], idxs)
+    return buf, row, idxs
 
 
 def predict_disease(symptoms: List[str], top_n: int = 3) -> Dict[str, Any]:
-    X_row = build_feature_vector(symptoms)
-    pred_idx = MODEL.predict(X_row)[0]
-    pred_label = LABEL_ENCODER.inverse_transform([pred_idx])[0]
+    buf, X_row, touched = build_feature_vector(symptoms)
+    try:
+        return _predict_from_row(X_row, buf, symptoms, top_n)
+    finally:
+        # Reset only the indices we set so the buffer is clean for the next call.
+        _clear_feats(buf[0], touched)
+
+
+def _predict_from_row(X_row: pd.DataFrame, buf: np.ndarray,
+                      symptoms: List[str], top_n: int) -> Dict[str, Any]:
+    # One predict_proba traversal covers both the top label (argmax) and the
+    # top-N list; calling predict() as well would walk the ensemble twice.
+    proba = None
+    if ORT_SESSION is not None:
+        # X_row is a view over buf, so the session can read the raw buffer
+        # directly. Output 1 is the (1, C) probability array (export disables
+        # zipmap; see export_onnx.py).
+        proba = ORT_SESSION.run(None, {ORT_INPUT_NAME: buf})[1][0]
+        pred_idx = int(np.argmax(proba))
+    elif hasattr(MODEL, 'predict_proba'):
+        proba = MODEL.predict_proba(X_row)[0]
+        pred_idx = int(np.argmax(proba))
+    else:
+        pred_idx = MODEL.predict(X_row)[0]
+    pred_label = CLASSES[pred_idx]
 
     result = {
         'predicted_disease': pred_label,
         'input_symptoms': symptoms,
     }
 
-    # Add disease information
-    if pred_label in disease_info['descriptions']:
-        result['description'] = disease_info['descriptions'][pred_label]
-    
-    if pred_label in disease_info['precautions']:
-        result['precautions'] = disease_info['precautions'][pred_label]
+    # Add disease information (single lookup per disease)
+    info = disease_info.get(pred_label)
+    if info:
+        result.update(info)
 
     # Probabilities (if supported)
-    if hasattr(MODEL, 'predict_proba'):
-        proba = MODEL.predict_proba(X_row)[0]
-        # Pair probabilities with class labels
-        pairs = list(zip(LABEL_ENCODER.classes_, proba))
-        pairs.sort(key=lambda x: x[1], reverse=True)
+    if proba is not None:
+        # Round the whole array in one vectorized op (float64 so the rounded
+        # values serialize cleanly) instead of round(float(p), 4) per class.
+        proba = np.round(proba.astype(np.float64, copy=False), 4)
+        # Partial selection of the top_n classes (O(C)), then sort just those,
+        # instead of pairing and fully sorting every class per request.
+        k = min(top_n, proba.size)
+        top_idx = np.argpartition(proba, -k)[-k:]
+        if pred_idx not in top_idx:
+            # Ties at the selection boundary can leave out the argmax class.
+            top_idx[np.argmin(proba[top_idx])] = pred_idx
+        # Order by probability desc, class index asc, so ties resolve the same
+        # way as argmax and the predicted label always heads the list.
+        top_idx = top_idx[np.lexsort((top_idx, -proba[top_idx]))]
         result['top_predictions'] = []
-        for d, p in pairs[:top_n]:
+        for i in top_idx:
+            d = CLASSES[i]
             disease_pred = {
                 'disease': d,
-                'probability': round(float(p), 4)
+                'probability': float(proba[i])
             }
             # Add description and precautions for each top prediction
-            if d in disease_info['descriptions']:
-                disease_pred['description'] = disease_info['descriptions'][d]
-            if d in disease_info['precautions']:
-                disease_pred['precautions'] = disease_info['precautions'][d]
+            info = disease_info.get(d)
+            if info:
+                disease_pred.update(info)
             result['top_predictions'].append(disease_pred)
     return result
 
@@ -194,17 +390,40 @@ def predict_disease(symptoms: List[str], top_n: int = 3) -> Dict[str, Any]:
 # AI Voice/Image Functions
 # -----------------------------------------------------------------------------
 
+# Shared client: instantiating Groq() per call rebuilds the HTTP connection
+# pool and TLS context; one module-level instance keeps connections alive.
+GROQ_CLIENT = (
+    Groq(api_key=os.environ.get("GROQ_API_KEY"))
+    if AI_FEATURES_AVAILABLE and os.environ.get("GROQ_API_KEY") else None
+)
+
+# Small shared pool for overlapping independent I/O-bound AI work
+_AI_POOL = ThreadPoolExecutor(max_workers=2)
+
+MEDICAL_IMAGE_PROMPT = """You are a professional doctor. What's in this image? Do you find anything wrong with it medically?
+        If you make a differential, suggest some remedies. Your response should be in one paragraph.
+        Answer as if you are answering to a real person. Don't say 'In the image I see' but say 'With what I see, I think you have....'
+        Keep your answer concise (max 2 sentences). No preamble, start your answer right away."""
+
+CONSULTATION_PROMPT = """You are a professional doctor. {transcription} What's in this image?
+        Do you find anything wrong with it medically? If you make a differential, suggest some remedies.
+        Your response should be in one paragraph. Answer as if you are answering to a real person.
+        Don't say 'In the image I see' but say 'With what I see, I think you have....'
+        Keep your answer concise (max 2 sentences). No preamble, start your answer right away."""
+
 def encode_image_from_bytes(image_bytes):
     """Convert image bytes to base64 encoding for AI analysis."""
-    return base64.b64encode(image_bytes).decode('utf-8')
+    # memoryview avoids copying the upload buffer into b64encode
+    return base64.b64encode(memoryview(image_bytes)).decode('ascii')
 
 def analyze_image_with_groq(query, encoded_image, model="meta-llama/llama-4-scout-17b-16e-instruct"):
     """Analyze medical image using GROQ AI."""
     if not AI_FEATURES_AVAILABLE:
         return "AI features not available. Please install required packages."
-    
+    if GROQ_CLIENT is None:
+        return "GROQ API key not configured."
+
     try:
-        client = Groq(api_key=os.environ.get("GROQ_API_KEY"))
         messages = [
             {
                 "role": "user",
@@ -222,7 +441,7 @@ def analyze_image_with_groq(query, encoded_image, model="meta-llama/llama-4-scou
                 ],
             }
         ]
-        chat_completion = client.chat.completions.create(
+        chat_completion = GROQ_CLIENT.chat.completions.create(
             messages=messages,
             model=model
         )
@@ -230,30 +449,27 @@ def analyze_image_with_groq(query, encoded_image, model="meta-llama/llama-4-scou
     except Exception as e:
         return f"Error analyzing image: {str(e)}"
 
-def transcribe_audio_with_groq(audio_bytes, model="whisper-large-v3"):
-    """Transcribe audio to text using GROQ."""
+def transcribe_audio_with_groq(audio, model="whisper-large-v3", filename="audio.mp3"):
+    """Transcribe audio to text using GROQ.
+
+    Accepts raw bytes or a file-like object (e.g. an upload's stream), so
+    callers don't have to buffer whole uploads into memory first.
+    """
     if not AI_FEATURES_AVAILABLE:
         return "AI features not available. Please install required packages."
-    
+    if GROQ_CLIENT is None:
+        return "GROQ API key not configured."
+
     try:
-        client = Groq(api_key=os.environ.get("GROQ_API_KEY"))
-        
-        # Save audio bytes to temporary file
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-            temp_file.write(audio_bytes)
-            temp_file_path = temp_file.name
-        
-        try:
-            with open(temp_file_path, "rb") as audio_file:
-                transcription = client.audio.transcriptions.create(
-                    model=model,
-                    file=audio_file,
-                    language="en"
-                )
-            return transcription.text
-        finally:
-            os.unlink(temp_file_path)
-            
+        if isinstance(audio, (bytes, bytearray)):
+            audio = BytesIO(audio)
+        transcription = GROQ_CLIENT.audio.transcriptions.create(
+            model=model,
+            file=(filename, audio),
+            language="en"
+        )
+        return transcription.text
+
     except Exception as e:
         return f"Error transcribing audio: {str(e)}"
 
@@ -264,19 +480,12 @@ def text_to_speech_gtts(text, language="en"):
     
     try:
         tts = gTTS(text=text, lang=language, slow=False)
-        
-        # Save to temporary file and read bytes
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-            tts.save(temp_file.name)
-            temp_file_path = temp_file.name
-        
-        try:
-            with open(temp_file_path, "rb") as audio_file:
-                audio_bytes = audio_file.read()
-            return audio_bytes
-        finally:
-            os.unlink(temp_file_path)
-            
+
+        # Stream straight into memory; avoids the temp-file write/read/unlink
+        buf = BytesIO()
+        tts.write_to_fp(buf)
+        return buf.getvalue()
+
     except Exception as e:
         print(f"Error generating speech: {e}")
         return None
@@ -307,9 +516,7 @@ BASE_TEMPLATE = """
   <form method="POST" action="{{ url_for('predict_form') }}">
     <label for="symptoms">Symptoms:</label><br />
     <select id="symptoms" name="symptoms" multiple>
-      {% for s in symptoms %}
-        <option value="{{ s }}" {% if s in selected %}selected{% endif %}>{{ s }}</option>
-      {% endfor %}
+      {{ options_html }}
     </select>
     <div style="margin-top:1rem;">
       <button type="submit">Predict</button>
@@ -339,11 +546,27 @@ BASE_TEMPLATE = """
 </html>
 """
 
+# Compile the template once; render_template_string would re-parse the whole
+# string on every request. The <option> list is static for GET requests, so
+# cache that too and only rebuild it when a selection has to be re-marked.
+BASE_TEMPLATE_COMPILED = app.jinja_env.from_string(BASE_TEMPLATE)
+OPTIONS_HTML_CACHE = Markup(''.join(
+    f'<option value="{escape(s)}">{escape(s)}</option>' for s in FEATURE_NAMES
+))
+
+def _options_html(selected: List[str]) -> Markup:
+    if not selected:
+        return OPTIONS_HTML_CACHE
+    chosen = set(selected)
+    return Markup(''.join(
+        f'<option value="{escape(s)}"{" selected" if s in chosen else ""}>{escape(s)}</option>'
+        for s in FEATURE_NAMES
+    ))
+
 # -----------------------------------------------------------------------------
 # Lifestyle Recommendation Generator
 # -----------------------------------------------------------------------------
 
-import numpy as np
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import LabelEncoder
 import warnings
@@ -548,8 +771,11 @@ class LifestyleRecommendationEngine:
             has_chronic = 1 if conditions else 0
             bmi_category = self.get_bmi_category(height, weight)
             
-            features = [[age_group, gender, has_chronic, activity_level, bmi_category, symptom_severity]]
-            
+            # float32 row so sklearn doesn't copy-convert the input
+            features = np.array(
+                [[age_group, gender, has_chronic, activity_level, bmi_category, symptom_severity]],
+                dtype=np.float32)
+
             # Get ML prediction
             prediction = self.model.predict(features)[0]
             prediction_proba = self.model.predict_proba(features)[0]
@@ -633,166 +859,158 @@ def predict_form():
     if request.method == 'POST':
         selected = request.form.getlist('symptoms')
         result = predict_disease(selected)
-    return render_template_string(
-        BASE_TEMPLATE,
-        symptoms=FEATURE_NAMES,
-        selected=selected,
+    return BASE_TEMPLATE_COMPILED.render(
+        options_html=_options_html(selected),
         result=result,
         meta=artifacts['meta'],
         feature_count=len(FEATURE_NAMES)
     )
 
+@functools.lru_cache(maxsize=4096)
+def _predict_json(symptoms_key: frozenset) -> bytes:
+    """Serialized prediction for a symptom set; common presentations repeat,
+    so identical requests skip model inference entirely. The artifacts are
+    loaded once per process, so entries stay valid for the cache's lifetime.
+    """
+    return orjson.dumps(predict_disease(sorted(symptoms_key)))
+
 @app.route('/api/predict', methods=['POST'])
 def api_predict():
     data = request.get_json(force=True, silent=True) or {}
     symptoms = data.get('symptoms', [])
-    if not isinstance(symptoms, list):
-        return jsonify({'error': 'symptoms must be a list of strings'}), 400
-    result = predict_disease(symptoms)
-    return jsonify(result)
+    if not isinstance(symptoms, list) or not all(isinstance(s, str) for s in symptoms):
+        return ojsonify({'error': 'symptoms must be a list of strings'}), 400
+    return Response(_predict_json(frozenset(symptoms)), mimetype='application/json')
 
 @app.route('/api/symptoms', methods=['GET'])
 def api_symptoms():
-    return jsonify({'symptoms': FEATURE_NAMES})
+    return _cached_json_response(SYMPTOMS_JSON, SYMPTOMS_ETAG)
 
 @app.route('/api/metadata', methods=['GET'])
 def api_metadata():
-    meta = artifacts['meta']
-    skinny = {
-        'model_timestamp': meta.get('created'),
-        'n_classes': len(LABEL_ENCODER.classes_),
-        'n_features': len(FEATURE_NAMES),
-        'classes': list(LABEL_ENCODER.classes_),  # Convert numpy array to list
-        'params': meta.get('params', {})
-    }
-    return jsonify(skinny)
+    return _cached_json_response(METADATA_JSON, METADATA_ETAG)
 
 @app.route('/api/disease-info', methods=['GET'])
 def api_disease_info():
     """Get disease descriptions and precautions"""
-    return jsonify(disease_info)
+    return _cached_json_response(DISEASE_INFO_JSON, DISEASE_INFO_ETAG)
 
 @app.route('/api/disease-info/<disease>', methods=['GET'])
 def api_disease_info_specific(disease):
     """Get specific disease information"""
-    result = {}
-    if disease in disease_info['descriptions']:
-        result['description'] = disease_info['descriptions'][disease]
-    if disease in disease_info['precautions']:
-        result['precautions'] = disease_info['precautions'][disease]
-    
-    if not result:
-        return jsonify({'error': f'Disease "{disease}" not found'}), 404
-    
+    info = disease_info.get(disease)
+    if not info:
+        return ojsonify({'error': f'Disease "{disease}" not found'}), 404
+
+    result = dict(info)
     result['disease'] = disease
-    return jsonify(result)
+    return ojsonify(result)
 
 @app.route('/api/ai/image-analysis', methods=['POST'])
 def api_ai_image_analysis():
     """Analyze medical image with AI."""
     if not AI_FEATURES_AVAILABLE:
-        return jsonify({'error': 'AI features not available'}), 503
+        return ojsonify({'error': 'AI features not available'}), 503
     
     if 'image' not in request.files:
-        return jsonify({'error': 'No image file provided'}), 400
+        return ojsonify({'error': 'No image file provided'}), 400
     
     image_file = request.files['image']
-    query = request.form.get('query', 
-        """You are a professional doctor. What's in this image? Do you find anything wrong with it medically? 
-        If you make a differential, suggest some remedies. Your response should be in one paragraph. 
-        Answer as if you are answering to a real person. Don't say 'In the image I see' but say 'With what I see, I think you have....'
-        Keep your answer concise (max 2 sentences). No preamble, start your answer right away.""")
+    query = request.form.get('query', MEDICAL_IMAGE_PROMPT)
     
     try:
         image_bytes = image_file.read()
         encoded_image = encode_image_from_bytes(image_bytes)
         analysis = analyze_image_with_groq(query, encoded_image)
         
-        return jsonify({
+        return ojsonify({
             'analysis': analysis,
             'query': query,
             'filename': image_file.filename
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @app.route('/api/ai/transcribe', methods=['POST'])
 def api_ai_transcribe():
     """Transcribe audio to text."""
     if not AI_FEATURES_AVAILABLE:
-        return jsonify({'error': 'AI features not available'}), 503
+        return ojsonify({'error': 'AI features not available'}), 503
     
     if 'audio' not in request.files:
-        return jsonify({'error': 'No audio file provided'}), 400
+        return ojsonify({'error': 'No audio file provided'}), 400
     
     audio_file = request.files['audio']
-    
+
     try:
-        audio_bytes = audio_file.read()
-        transcription = transcribe_audio_with_groq(audio_bytes)
-        
-        return jsonify({
+        # Hand the upload's stream straight to the client; no full read() copy
+        transcription = transcribe_audio_with_groq(
+            audio_file.stream, filename=audio_file.filename or "audio.mp3")
+
+        return ojsonify({
             'transcription': transcription,
             'filename': audio_file.filename
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @app.route('/api/ai/text-to-speech', methods=['POST'])
 def api_ai_text_to_speech():
     """Convert text to speech."""
     if not AI_FEATURES_AVAILABLE:
-        return jsonify({'error': 'AI features not available'}), 503
+        return ojsonify({'error': 'AI features not available'}), 503
     
     data = request.get_json(force=True, silent=True) or {}
     text = data.get('text', '')
     language = data.get('language', 'en')
     
     if not text:
-        return jsonify({'error': 'No text provided'}), 400
+        return ojsonify({'error': 'No text provided'}), 400
     
     try:
         audio_bytes = text_to_speech_gtts(text, language)
         if audio_bytes:
             # Return base64 encoded audio
             audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
-            return jsonify({
+            return ojsonify({
                 'audio': audio_base64,
                 'text': text,
                 'language': language
             })
         else:
-            return jsonify({'error': 'Failed to generate speech'}), 500
+            return ojsonify({'error': 'Failed to generate speech'}), 500
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @app.route('/api/ai/full-consultation', methods=['POST'])
 def api_ai_full_consultation():
     """Complete AI consultation with audio transcription, image analysis, and TTS response."""
     if not AI_FEATURES_AVAILABLE:
-        return jsonify({'error': 'AI features not available'}), 503
+        return ojsonify({'error': 'AI features not available'}), 503
     
-    # Get transcription from audio if provided
-    transcription = ""
+    # Kick off transcription first; the image query depends on its result, so
+    # the two Groq calls can't run fully concurrently, but reading and
+    # base64-encoding the image upload overlaps with the transcription call.
+    transcription_future = None
     if 'audio' in request.files:
         audio_file = request.files['audio']
-        audio_bytes = audio_file.read()
-        transcription = transcribe_audio_with_groq(audio_bytes)
-    
-    # Get image analysis if provided
-    image_analysis = ""
+        transcription_future = _AI_POOL.submit(
+            transcribe_audio_with_groq, audio_file.stream,
+            filename=audio_file.filename or "audio.mp3")
+
+    encoded_image = None
     if 'image' in request.files:
-        image_file = request.files['image']
-        image_bytes = image_file.read()
+        image_bytes = request.files['image'].read()
         encoded_image = encode_image_from_bytes(image_bytes)
-        
+
+    transcription = transcription_future.result() if transcription_future else ""
+
+    # Get image analysis if provided
+    image_analysis = ""
+    if encoded_image is not None:
         # Combine transcription with medical analysis prompt
-        query = f"""You are a professional doctor. {transcription} What's in this image? 
-        Do you find anything wrong with it medically? If you make a differential, suggest some remedies. 
-        Your response should be in one paragraph. Answer as if you are answering to a real person. 
-        Don't say 'In the image I see' but say 'With what I see, I think you have....'
-        Keep your answer concise (max 2 sentences). No preamble, start your answer right away."""
-        
+        query = CONSULTATION_PROMPT.format(transcription=transcription)
+
         image_analysis = analyze_image_with_groq(query, encoded_image)
     
     # Generate audio response
@@ -800,7 +1018,7 @@ def api_ai_full_consultation():
     audio_bytes = text_to_speech_gtts(response_text)
     audio_base64 = base64.b64encode(audio_bytes).decode('utf-8') if audio_bytes else None
     
-    return jsonify({
+    return ojsonify({
         'transcription': transcription,
         'analysis': image_analysis,
         'response_text': response_text,
@@ -813,7 +1031,7 @@ def api_lifestyle_recommendations():
     try:
         data = request.get_json()
         if not data:
-            return jsonify({'error': 'No data provided'}), 400
+            return ojsonify({'error': 'No data provided'}), 400
         
         # Extract user profile from request
         user_profile = {
@@ -830,7 +1048,7 @@ def api_lifestyle_recommendations():
         # Generate recommendations
         recommendations = lifestyle_engine.generate_recommendations(user_profile)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'user_profile': user_profile,
             'recommendations': recommendations,
@@ -838,7 +1056,7 @@ def api_lifestyle_recommendations():
         })
         
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': f'Failed to generate recommendations: {str(e)}'
         }), 500
@@ -851,5 +1069,7 @@ def health():
 # Main Entry
 # -----------------------------------------------------------------------------
 if __name__ == '__main__':
+    # Dev server only; deploy under gunicorn via wsgi.py (see README).
+    # debug (and its reloader) is opt-in so production runs don't pick it up.
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=True)
+    app.run(host='0.0.0.0', port=port, debug=os.environ.get('FLASK_DEBUG') == '1')
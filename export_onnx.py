@@ -0,0 +1,48 @@
+"""Export the trained sklearn model to ONNX for faster inference.
+
+Converts the joblib model referenced by the latest metadata file into an
+.onnx file next to it. app.py picks the export up automatically when
+onnxruntime is installed; otherwise it keeps using the joblib model.
+
+Usage:
+    pip install skl2onnx onnxruntime
+    python export_onnx.py
+"""
+import os
+import json
+import glob
+
+import joblib
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+
+MODELS_DIR = os.path.join(os.path.dirname(__file__), 'models')
+
+
+def main():
+    meta_files = sorted(glob.glob(os.path.join(MODELS_DIR, 'model_metadata_*.json')))
+    if not meta_files:
+        raise SystemExit("No metadata JSON files found in 'models' directory.")
+    with open(meta_files[-1], 'r') as f:
+        meta = json.load(f)
+
+    model_path = os.path.join(MODELS_DIR, meta['model_file'])
+    model = joblib.load(model_path)
+    n_features = int(model.n_features_in_)
+
+    # zipmap off so probabilities come back as a plain (1, C) float array
+    # instead of a list of dicts; app.py relies on that shape.
+    onnx_model = convert_sklearn(
+        model,
+        initial_types=[('input', FloatTensorType([None, n_features]))],
+        options={id(model): {'zipmap': False}},
+    )
+
+    onnx_path = os.path.splitext(model_path)[0] + '.onnx'
+    with open(onnx_path, 'wb') as f:
+        f.write(onnx_model.SerializeToString())
+    print(f"Exported {model_path} -> {onnx_path}")
+
+
+if __name__ == '__main__':
+    main()
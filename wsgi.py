@@ -0,0 +1,16 @@
+"""WSGI entry point for production servers.
+
+The Flask dev server in app.py is single-process; run this module under a
+real WSGI server instead, e.g.:
+
+    gunicorn -w $(nproc) -k gthread --threads 8 -b 0.0.0.0:5000 wsgi:app
+
+The AI endpoints are I/O-bound (Groq/gTTS network calls), so threaded
+workers keep many consultations in flight; sklearn releases the GIL in its
+native code during prediction, and the prediction input buffers are
+thread-local so concurrent requests in one worker don't interfere.
+"""
+from app import app
+
+if __name__ == "__main__":
+    app.run()